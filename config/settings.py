@@ -18,6 +18,15 @@ CHUNK_OVERLAP = 200
 TOP_K_RETRIEVAL = 5
 SIMILARITY_THRESHOLD = 0.7
 
+# Index serving settings
+# Memory-map the FAISS index read-only so worker processes share its pages
+FAISS_USE_MMAP = os.getenv("FAISS_USE_MMAP", "false").lower() in ("1", "true", "yes")
+
+# Chat history settings
+MAX_CHAT_HISTORY = max(2, int(os.getenv("MAX_CHAT_HISTORY", "50")))  # messages kept verbatim, at least one turn
+CHAT_DISPLAY_WINDOW = max(1, int(os.getenv("CHAT_DISPLAY_WINDOW", "10")))  # recent messages rendered per page
+SUMMARY_SNIPPET_LENGTH = 120  # characters kept per summarized message
+
 # Paths
 DATA_PATH = "data"
 PDF_PATH = os.path.join(DATA_PATH, "book.pdf")
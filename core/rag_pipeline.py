@@ -3,7 +3,7 @@ import streamlit as st
 from typing import List, Dict
 from .pdf_processor import PDFProcessor
 from .embeddings import EmbeddingGenerator
-from .vector_store import VectorStore
+from .vector_store import get_shared_vector_store
 from models.groq_client import GroqClient
 from config.settings import TOP_K_RETRIEVAL
 
@@ -11,14 +11,14 @@ class RAGPipeline:
     def __init__(self):
         self.pdf_processor = PDFProcessor()
         self.embedding_generator = EmbeddingGenerator()
-        self.vector_store = VectorStore()
+        self.vector_store = get_shared_vector_store()
         self.groq_client = GroqClient()
         self._initialize_index()
     
     def _initialize_index(self):
         """Initialize or load the FAISS index"""
-        # Try to load existing index
-        if not self.vector_store.load_index():
+        # The shared store has already loaded any existing index
+        if self.vector_store.index is None:
             # Create new index from book PDF
             self._create_index_from_book()
     
@@ -63,6 +63,9 @@ class RAGPipeline:
                 if len(query_embedding) == 0:
                     return "Sorry, I couldn't process your query."
                 
+                # Pick up a newer index version if one has landed
+                self.vector_store = get_shared_vector_store()
+                
                 # Search for relevant chunks
                 relevant_chunks = self.vector_store.search(query_embedding, k=TOP_K_RETRIEVAL)
                 
@@ -3,14 +3,16 @@ import faiss
 import numpy as np
 import pickle
 import os
+import tempfile
 import streamlit as st
 from typing import List, Dict
-from config.settings import FAISS_INDEX_PATH
+from config.settings import FAISS_INDEX_PATH, FAISS_USE_MMAP
 
 class VectorStore:
-    def __init__(self):
+    def __init__(self, use_mmap: bool = FAISS_USE_MMAP):
         self.index = None
         self.documents = []
+        self.use_mmap = use_mmap
         self.index_path = os.path.join(FAISS_INDEX_PATH, "faiss.index")
         self.docs_path = os.path.join(FAISS_INDEX_PATH, "documents.pkl")
     
@@ -46,7 +48,7 @@ class VectorStore:
         """Load existing FAISS index from disk"""
         try:
             if os.path.exists(self.index_path) and os.path.exists(self.docs_path):
-                self.index = faiss.read_index(self.index_path)
+                self.index = self._read_index()
                 with open(self.docs_path, 'rb') as f:
                     self.documents = pickle.load(f)
                 return True
@@ -54,15 +56,58 @@ class VectorStore:
             st.warning(f"Could not load existing index: {str(e)}")
         return False
     
+    def _read_index(self):
+        """Read the FAISS index, memory-mapped read-only when enabled"""
+        if not self.use_mmap:
+            return faiss.read_index(self.index_path)
+        
+        # Only IO_FLAG_MMAP_IFC maps the codes of flat indexes like ours;
+        # IO_FLAG_MMAP covers IVF inverted lists and would share nothing here
+        mmap_flag = getattr(faiss, "IO_FLAG_MMAP_IFC", None)
+        if mmap_flag is None:
+            st.warning("This FAISS build cannot memory-map flat indexes (no IO_FLAG_MMAP_IFC); "
+                       "reading the index into memory, so it is not shared between workers")
+            return faiss.read_index(self.index_path)
+        
+        try:
+            return faiss.read_index(self.index_path, mmap_flag | faiss.IO_FLAG_READ_ONLY)
+        except Exception as e:
+            st.warning(f"Memory-mapped load failed, reading index into memory: {str(e)}")
+            return faiss.read_index(self.index_path)
+    
+    def get_index_version(self) -> int:
+        """Return the on-disk index version (modification time in ns), 0 if missing"""
+        try:
+            return os.stat(self.index_path).st_mtime_ns
+        except OSError:
+            return 0
+    
     def save_index(self):
         """Save FAISS index to disk"""
+        # Write to temp files and swap them in atomically so processes that
+        # memory-map the current index never see a partially written file.
+        # The index is replaced last since its mtime marks a new version.
+        # Temp names are unique per call so concurrent savers don't collide.
+        tmp_paths = []
         try:
             os.makedirs(FAISS_INDEX_PATH, exist_ok=True)
-            faiss.write_index(self.index, self.index_path)
-            with open(self.docs_path, 'wb') as f:
+            fd, docs_tmp = tempfile.mkstemp(dir=FAISS_INDEX_PATH, suffix=".tmp")
+            tmp_paths.append(docs_tmp)
+            with os.fdopen(fd, 'wb') as f:
                 pickle.dump(self.documents, f)
+            fd, index_tmp = tempfile.mkstemp(dir=FAISS_INDEX_PATH, suffix=".tmp")
+            tmp_paths.append(index_tmp)
+            os.close(fd)
+            faiss.write_index(self.index, index_tmp)
+            os.replace(docs_tmp, self.docs_path)
+            os.replace(index_tmp, self.index_path)
         except Exception as e:
             st.error(f"Error saving index: {str(e)}")
+        finally:
+            # Remove this call's leftovers from a failed save
+            for tmp_path in tmp_paths:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
     
     def search(self, query_embedding: np.ndarray, k: int = 5) -> List[Dict]:
         """Search for similar documents"""
@@ -90,3 +135,14 @@ class VectorStore:
         except Exception as e:
             st.error(f"Error searching index: {str(e)}")
             return []
+
+@st.cache_resource(max_entries=1)
+def _load_vector_store(index_version: int) -> VectorStore:
+    """Load the vector store once per process for a given index version"""
+    store = VectorStore()
+    store.load_index()
+    return store
+
+def get_shared_vector_store() -> VectorStore:
+    """Get the process-wide vector store, reloading when a new index version lands"""
+    return _load_vector_store(VectorStore().get_index_version())
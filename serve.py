@@ -0,0 +1,114 @@
+import argparse
+import faiss
+import os
+import subprocess
+import sys
+import time
+import urllib.request
+from typing import List
+from config.settings import FAISS_INDEX_PATH
+from core.vector_store import VectorStore
+
+def wait_until_healthy(port: int, timeout: float = 60.0) -> bool:
+    """Poll a worker's Streamlit health endpoint until it responds or times out"""
+    url = f"http://localhost:{port}/_stcore/health"
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=2) as response:
+                if response.status == 200:
+                    return True
+        except OSError:
+            pass
+        time.sleep(0.5)
+    return False
+
+def start_worker(port: int) -> subprocess.Popen:
+    """Start one Streamlit worker that memory-maps the shared index"""
+    env = dict(os.environ, FAISS_USE_MMAP="true")
+    command = [
+        sys.executable, "-m", "streamlit", "run", "streamlit_app.py",
+        "--server.port", str(port),
+        "--server.headless", "true",
+    ]
+    print(f"Starting worker on port {port}")
+    return subprocess.Popen(command, env=env)
+
+def stop_worker(worker: subprocess.Popen, timeout: float = 10.0):
+    """Stop a worker, killing it if it does not exit in time"""
+    if worker.poll() is not None:
+        return
+    worker.terminate()
+    try:
+        worker.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        worker.kill()
+        worker.wait()
+
+def restart_workers(workers: List[subprocess.Popen], ports: List[int]):
+    """Restart workers one at a time, waiting for each to become healthy
+    before stopping the next. A restarting worker's port is down meanwhile,
+    so only clients behind a health-checking load balancer stay served"""
+    for i, port in enumerate(ports):
+        stop_worker(workers[i])
+        workers[i] = start_worker(port)
+        if not wait_until_healthy(port):
+            print(f"Worker on port {port} did not become healthy, continuing")
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run several Streamlit workers sharing one memory-mapped FAISS index",
+        epilog="Workers pick up a new index version on their own. Put a load balancer "
+               "that health-checks /_stcore/health on each port in front of them; "
+               "a worker's port is down while it restarts."
+    )
+    parser.add_argument("--workers", type=int, default=2, help="Number of worker processes")
+    parser.add_argument("--base-port", type=int, default=8501, help="Port of the first worker")
+    parser.add_argument("--poll-interval", type=float, default=5.0,
+                        help="Seconds between checks for a new index version")
+    parser.add_argument("--restart-on-new-index", action="store_true",
+                        help="Also do a rolling restart of workers when a new index lands "
+                             "(drops live sessions on each restarted worker)")
+    args = parser.parse_args()
+
+    if not hasattr(faiss, "IO_FLAG_MMAP_IFC"):
+        print(f"FAISS {faiss.__version__} cannot memory-map flat indexes (no IO_FLAG_MMAP_IFC), "
+              "so workers would not share the index. Install faiss-cpu>=1.11.0.")
+        sys.exit(1)
+
+    store = VectorStore(use_mmap=True)
+    if not (os.path.exists(store.index_path) and os.path.exists(store.docs_path)):
+        print(f"No prebuilt index found in '{FAISS_INDEX_PATH}'. "
+              "Run the app once to build it before starting workers.")
+        sys.exit(1)
+
+    ports = [args.base_port + i for i in range(args.workers)]
+    workers = [start_worker(port) for port in ports]
+    version = store.get_index_version()
+
+    try:
+        while True:
+            time.sleep(args.poll_interval)
+
+            # Bring back any worker that exited unexpectedly
+            for i, port in enumerate(ports):
+                if workers[i].poll() is not None:
+                    print(f"Worker on port {port} exited, restarting")
+                    workers[i] = start_worker(port)
+
+            new_version = store.get_index_version()
+            if new_version and new_version != version:
+                version = new_version
+                if args.restart_on_new_index:
+                    print("New index version detected, restarting workers")
+                    restart_workers(workers, ports)
+                else:
+                    print("New index version detected, workers will load it on their next query")
+    except KeyboardInterrupt:
+        print("Shutting down workers")
+    finally:
+        for worker in workers:
+            stop_worker(worker)
+
+if __name__ == "__main__":
+    main()
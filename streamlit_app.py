@@ -1,7 +1,10 @@
 
 import streamlit as st
 import os
-from utils.session_state import initialize_session_state, get_rag_pipeline, add_message, clear_chat_history
+from utils.session_state import (
+    initialize_session_state, get_rag_pipeline, add_message, clear_chat_history,
+    get_visible_messages, has_hidden_messages, show_more_messages, get_history_summary
+)
 from utils.helpers import check_book_pdf_exists, get_pdf_info, validate_api_keys, create_data_directories
 from config.settings import PDF_PATH
 
@@ -114,45 +117,72 @@ def render_main_interface():
     # Chat interface
     st.subheader("💬 Chat with your Book")
     
-    # Display chat messages
-    for message in st.session_state.messages:
-        with st.chat_message(message["role"]):
-            st.write(message["content"])
-            
-            # Show sources for assistant messages
-            if message["role"] == "assistant" and message.get("sources"):
-                with st.expander("📚 Sources"):
-                    for i, source in enumerate(message["sources"], 1):
-                        st.write(f"**{i}. Page {source.get('page', 'Unknown')}** "
-                                f"(Relevance: {source.get('similarity_score', 0):.3f})")
-                        st.write(f"_{source.get('text', '')[:200]}..._")
-    
-    # Chat input
-    if prompt := st.chat_input("Ask me anything about the book..."):
-        # Add user message
+    # Read the chat input first so the history below is drawn from the
+    # updated state; the input box stays pinned to the bottom of the page
+    prompt = st.chat_input("Ask me anything about the book...")
+    if prompt:
         add_message("user", prompt)
-        
-        # Display user message immediately
-        with st.chat_message("user"):
-            st.write(prompt)
-        
+    
+    # Placeholders filled at the end of the run, once history is final
+    summary_slot = st.empty()
+    more_slot = st.empty()
+    
+    # Display only the recent window of chat messages
+    history_slot = st.empty()
+    render_history(history_slot)
+    
+    if prompt:
         # Generate and display assistant response
-        with st.chat_message("assistant"):
-            try:
-                rag = get_rag_pipeline()
-                response = rag.process_query(prompt)
-                st.write(response)
-                
-                # Add assistant message to history
-                add_message("assistant", response)
-                
-            except Exception as e:
-                error_msg = f"Sorry, I encountered an error: {str(e)}"
-                st.error(error_msg)
-                add_message("assistant", error_msg)
+        pending_slot = st.empty()
+        with pending_slot.container():
+            with st.chat_message("assistant"):
+                try:
+                    rag = get_rag_pipeline()
+                    response = rag.process_query(prompt)
+                    st.write(response)
+                    
+                    # Add assistant message to history
+                    add_message("assistant", response)
+                    
+                except Exception as e:
+                    error_msg = f"Sorry, I encountered an error: {str(e)}"
+                    st.error(error_msg)
+                    add_message("assistant", error_msg)
+        
+        # Redraw the window from history instead of calling st.rerun(); this
+        # also drops any turns the new answer pushed into the summary
+        pending_slot.empty()
+        render_history(history_slot)
+    
+    # Summary of older turns dropped from the history
+    summary = get_history_summary()
+    if summary:
+        with summary_slot.container():
+            with st.expander("🗂️ Earlier conversation (truncated)"):
+                st.text("\n".join(summary))
+    
+    # Page in older stored messages on request
+    if has_hidden_messages():
+        more_slot.button("⬆️ Show earlier messages", on_click=show_more_messages)
+
+def render_history(slot):
+    """Render the visible window of chat messages into a placeholder"""
+    with slot.container():
+        for message in get_visible_messages():
+            render_message(message)
+
+def render_message(message):
+    """Render a single chat message with its sources"""
+    with st.chat_message(message["role"]):
+        st.write(message["content"])
         
-        # Rerun to update the interface
-        st.rerun()
+        # Show sources for assistant messages
+        if message["role"] == "assistant" and message.get("sources"):
+            with st.expander("📚 Sources"):
+                for i, source in enumerate(message["sources"], 1):
+                    st.write(f"**{i}. Page {source.get('page', 'Unknown')}** "
+                            f"(Relevance: {source.get('similarity_score', 0):.3f})")
+                    st.write(f"_{source.get('text', '')[:200]}..._")
 
 if __name__ == "__main__":
     main()
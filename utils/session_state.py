@@ -1,7 +1,8 @@
 
 import streamlit as st
-from datetime import datetime
+import time
 from typing import List, Dict, Any
+from config.settings import MAX_CHAT_HISTORY, CHAT_DISPLAY_WINDOW, SUMMARY_SNIPPET_LENGTH
 
 def initialize_session_state():
     """Initialize all session state variables"""
@@ -10,6 +11,18 @@ def initialize_session_state():
     if 'messages' not in st.session_state:
         st.session_state.messages = []
     
+    # Condensed summary of turns dropped from the history
+    if 'history_summary' not in st.session_state:
+        st.session_state.history_summary = []
+    
+    # Count of summarized messages later dropped from the summary too
+    if 'omitted_messages' not in st.session_state:
+        st.session_state.omitted_messages = 0
+    
+    # Number of recent messages currently shown
+    if 'display_window' not in st.session_state:
+        st.session_state.display_window = CHAT_DISPLAY_WINDOW
+    
     # RAG pipeline
     if 'rag_pipeline' not in st.session_state:
         st.session_state.rag_pipeline = None
@@ -29,19 +42,94 @@ def get_chat_history() -> List[Dict[str, Any]]:
     """Get formatted chat history"""
     return st.session_state.messages
 
+def _turn_start(messages: List[Dict[str, Any]], index: int) -> int:
+    """Move a slice start back so it doesn't begin with an answer"""
+    while index > 0 and messages[index]['role'] == "assistant":
+        index -= 1
+    return index
+
+def _visible_start() -> int:
+    """Index of the first message within the display window"""
+    messages = st.session_state.messages
+    start = max(0, len(messages) - st.session_state.display_window)
+    return _turn_start(messages, start)
+
+def get_visible_messages() -> List[Dict[str, Any]]:
+    """Get the most recent messages within the display window"""
+    return st.session_state.messages[_visible_start():]
+
+def has_hidden_messages() -> bool:
+    """Check whether older stored messages are outside the display window"""
+    return _visible_start() > 0
+
+def show_more_messages():
+    """Extend the display window by one page of older messages"""
+    st.session_state.display_window += CHAT_DISPLAY_WINDOW
+
+def get_history_summary() -> List[str]:
+    """Get summary lines for turns dropped from the history"""
+    summary = st.session_state.history_summary
+    omitted = st.session_state.omitted_messages
+    if omitted:
+        return [f"... {omitted} earlier messages omitted"] + summary
+    return summary
+
+def _summarize_message(message: Dict[str, Any]) -> str:
+    """Condense a message into a single summary line"""
+    content = " ".join(message['content'].split())
+    if len(content) > SUMMARY_SNIPPET_LENGTH:
+        content = content[:SUMMARY_SNIPPET_LENGTH].rstrip() + "..."
+    prefix = "Q" if message['role'] == "user" else "A"
+    return f"{prefix}: {content}"
+
+def _compact_sources(sources: List[Dict]) -> List[Dict]:
+    """Keep only the source fields the chat view displays"""
+    return [
+        {
+            'page': source.get('page', 'Unknown'),
+            'similarity_score': source.get('similarity_score', 0),
+            'text': source.get('text', '')[:200]
+        }
+        for source in sources
+    ]
+
 def add_message(role: str, content: str, sources: List[Dict] = None):
-    """Add message to chat history"""
+    """Add message to chat history, summarizing the oldest beyond the cap"""
     message = {
         'role': role,
         'content': content,
-        'timestamp': datetime.now(),
-        'sources': sources or []
+        'timestamp': time.time(),
+        'sources': _compact_sources(sources or [])
     }
-    st.session_state.messages.append(message)
+    messages = st.session_state.messages
+    messages.append(message)
+    
+    # A new question collapses any paged-in history back to the recent window
+    if role == "user":
+        st.session_state.display_window = CHAT_DISPLAY_WINDOW
+    
+    overflow = len(messages) - MAX_CHAT_HISTORY
+    if overflow > 0:
+        # Evict whole question/answer turns so no answer loses its question
+        while overflow < len(messages) and messages[overflow]['role'] == "assistant":
+            overflow += 1
+        summary = st.session_state.history_summary
+        summary.extend(_summarize_message(old) for old in messages[:overflow])
+        del messages[:overflow]
+        # Keep the summary itself bounded, counting what falls off
+        dropped = len(summary) - MAX_CHAT_HISTORY
+        while 0 < dropped < len(summary) and summary[dropped].startswith("A: "):
+            dropped += 1
+        if dropped > 0:
+            st.session_state.omitted_messages += dropped
+            del summary[:dropped]
 
 def clear_chat_history():
     """Clear all chat messages"""
     st.session_state.messages = []
+    st.session_state.history_summary = []
+    st.session_state.omitted_messages = 0
+    st.session_state.display_window = CHAT_DISPLAY_WINDOW
 
 def get_rag_pipeline():
     """Get or initialize RAG pipeline"""